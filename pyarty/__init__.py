@@ -1,37 +1,66 @@
 """pyarty package public API."""
 
-from .dsl import (
-    BundleDefinition,
-    BundleError,
-    BundleField,
-    BundleMetadata,
-    BundleMetadataError,
-    FieldKind,
-    Hint,
-    HintKind,
-    Dir,
-    File,
-    bundle,
-    twig,
-)
-from .reader import InferredBundle, infer_bundle_from_directory
-from .writer import RenderError, write_bundle
-
-__all__ = [
-    "Dir",
-    "File",
-    "bundle",
-    "twig",
-    "BundleError",
-    "BundleMetadataError",
-    "BundleMetadata",
-    "BundleField",
-    "BundleDefinition",
-    "FieldKind",
-    "Hint",
-    "HintKind",
-    "RenderError",
-    "write_bundle",
-    "InferredBundle",
-    "infer_bundle_from_directory",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from .dsl import (
+        BundleDefinition,
+        BundleError,
+        BundleField,
+        BundleMetadata,
+        BundleMetadataError,
+        FieldKind,
+        Hint,
+        HintKind,
+        Dir,
+        File,
+        bundle,
+        twig,
+    )
+    from .reader import InferredBundle, infer_bundle_from_directory
+    from .writer import RenderError, write_bundle
+
+# Public names resolve lazily to their submodule on first access, so e.g.
+# defining bundles never imports the reader.
+_LAZY_EXPORTS = {
+    "Dir": "dsl",
+    "File": "dsl",
+    "bundle": "dsl",
+    "twig": "dsl",
+    "BundleError": "dsl",
+    "BundleMetadataError": "dsl",
+    "BundleMetadata": "dsl",
+    "BundleField": "dsl",
+    "BundleDefinition": "dsl",
+    "FieldKind": "dsl",
+    "Hint": "dsl",
+    "HintKind": "dsl",
+    "RenderError": "writer",
+    "write_bundle": "writer",
+    "InferredBundle": "reader",
+    "infer_bundle_from_directory": "reader",
+}
+
+# Submodules stay reachable as attributes (``pyarty.writer``) without being
+# imported up front.
+_SUBMODULES = frozenset({"dsl", "reader", "writer"})
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS) | _SUBMODULES)
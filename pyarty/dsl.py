@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import collections.abc as abc
+import inspect
+import string
+import sys
 from dataclasses import Field as DataclassField
 from dataclasses import dataclass, field as dataclass_field, fields, is_dataclass
+from dataclasses import replace
 from enum import Enum
-from functools import wraps
-from pathlib import Path
+from functools import lru_cache, wraps
 from types import MappingProxyType
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    ForwardRef,
+    FrozenSet,
     Generic,
-    Iterable,
     Mapping,
     MutableMapping,
     Sequence,
@@ -24,10 +29,12 @@ from typing import (
     Union,
     get_args,
     get_origin,
-    get_type_hints,
 )
 
 
+if TYPE_CHECKING:  # pragma: no cover - annotation only; pathlib is slow to import
+    from pathlib import Path
+
 try:  # Python < 3.9 compatibility for typing.Annotated
     from typing import Annotated  # type: ignore
 except ImportError:  # pragma: no cover - best effort fallback
@@ -88,7 +95,7 @@ class HintKind(str, Enum):
     CALLABLE = "callable"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BundleMetadata:
     """Normalized metadata targeting a specific DSL layer."""
 
@@ -97,7 +104,7 @@ class BundleMetadata:
     data: Mapping[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BundleField:
     """Representation of a dataclass field participating in the bundle DSL."""
 
@@ -107,26 +114,99 @@ class BundleField:
     dataclass_field: DataclassField[Any]
     metadata: Tuple[BundleMetadata, ...] = dataclass_field(default_factory=tuple)
     raw_metadata: Mapping[str, Any] = dataclass_field(
-        default_factory=lambda: MappingProxyType({})
+        default_factory=lambda: _EMPTY_METADATA
     )
     is_collection: bool = False
+    dir_payload_cls: Type[Any] | None = None
+    # Derived from ``metadata`` in __post_init__ so they always agree with it.
+    metadata_by_layer: Mapping[Type[Any], Mapping[str, Any]] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+    extension: str | None = dataclass_field(init=False, repr=False, compare=False)
+    name_hint: Hint | None = dataclass_field(init=False, repr=False, compare=False)
+    prefix_hint: Hint | None = dataclass_field(init=False, repr=False, compare=False)
+    copyfile: bool = dataclass_field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        metadata_by_layer = _index_metadata_by_layer(self.metadata)
+        # The field's own layer (Dir for DIR fields, File for FILE fields)
+        # supplies its naming, extension and copy settings.
+        own_layer = metadata_by_layer.get(
+            _LAYER_BY_KIND.get(self.kind), _EMPTY_METADATA
+        )
+        object.__setattr__(self, "metadata_by_layer", metadata_by_layer)
+        object.__setattr__(
+            self,
+            "extension",
+            own_layer.get(_KEY_EXTENSION) if self.kind is FieldKind.FILE else None,
+        )
+        object.__setattr__(self, "name_hint", own_layer.get(_KEY_NAME))
+        object.__setattr__(self, "prefix_hint", own_layer.get(_KEY_PREFIX) or None)
+        object.__setattr__(self, "copyfile", bool(own_layer.get(_KEY_COPYFILE)))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Hint:
     """Normalized runtime naming hint."""
 
     kind: HintKind
     value: Any
     source: str
+    compiled: Tuple[Tuple[str, str | None, str, str | None], ...] | None = (
+        dataclass_field(default=None, compare=False, repr=False)
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BundleDefinition:
-    """Container describing the structure of a bundle-decorated dataclass."""
+    """Container describing the structure of a bundle-decorated dataclass.
+
+    ``fields_by_name`` and ``field_names`` index :attr:`fields` by name; use
+    them instead of scanning ``fields`` for a single entry.
+    """
 
     cls: Type[Any]
     fields: Tuple[BundleField, ...]
+    # Derived from ``fields`` in __post_init__ so they always agree with it.
+    dir_fields: Tuple[BundleField, ...] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+    file_fields: Tuple[BundleField, ...] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+    value_fields: Tuple[BundleField, ...] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+    collection_dir_fields: Tuple[BundleField, ...] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+    fields_by_name: Mapping[str, BundleField] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+    field_names: FrozenSet[str] = dataclass_field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        bundle_fields = tuple(self.fields)
+        partitions: Dict[FieldKind, list[BundleField]] = {
+            kind: [] for kind in FieldKind
+        }
+        for bundle_field in bundle_fields:
+            partitions[bundle_field.kind].append(bundle_field)
+        dir_fields = tuple(partitions[FieldKind.DIR])
+        fields_by_name = MappingProxyType({f.name: f for f in bundle_fields})
+        object.__setattr__(self, "fields", bundle_fields)
+        object.__setattr__(self, "dir_fields", dir_fields)
+        object.__setattr__(self, "file_fields", tuple(partitions[FieldKind.FILE]))
+        object.__setattr__(self, "value_fields", tuple(partitions[FieldKind.VALUE]))
+        object.__setattr__(
+            self,
+            "collection_dir_fields",
+            tuple(f for f in dir_fields if f.is_collection),
+        )
+        object.__setattr__(self, "fields_by_name", fields_by_name)
+        object.__setattr__(self, "field_names", frozenset(fields_by_name))
 
 
 DEFAULT_DATACLASS_KWARGS: Mapping[str, Any] = MappingProxyType(
@@ -139,12 +219,30 @@ DEFAULT_DATACLASS_KWARGS: Mapping[str, Any] = MappingProxyType(
 
 BundleClass = TypeVar("BundleClass", bound=type)
 
+# Metadata mappings are read-only proxies, so the empty and extension-only
+# ones can be shared between fields and bundles without leaking mutations.
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+# Metadata keys are looked up per field on every render; interning guarantees
+# the identity fast path in dict lookups regardless of how the key was built.
+_KEY_NAME = sys.intern("name")
+_KEY_EXTENSION = sys.intern("extension")
+_KEY_PREFIX = sys.intern("prefix")
+_KEY_COPYFILE = sys.intern("copyfile")
+
+# Metadata layer that holds a field's own naming/extension settings.
+_LAYER_BY_KIND: Mapping[FieldKind, Type[Any]] = {FieldKind.DIR: Dir, FieldKind.FILE: File}
+
 INSTANCE_METADATA_ATTR = "__bundle_instance_metadata__"
 INIT_WRAPPED_ATTR = "__bundle_init_wrapped__"
 RUNTIME_METADATA_KWARG = "__bundle_metadata__"
 _HINT_SOURCES = ("self", "field")
 _DEFAULT_HINT_SOURCE = "self"
 
+# Below this many files a thread pool costs more than the I/O it overlaps.
+# Used by both the writer (payload writes) and the reader (payload reads).
+_PARALLEL_IO_THRESHOLD = 8
+
 
 def bundle(
     cls: BundleClass | None = None, /, **dataclass_kwargs: Any
@@ -160,10 +258,14 @@ def bundle(
     def _decorate(target_cls: BundleClass) -> BundleClass:
         actual_cls = target_cls
         if not is_dataclass(actual_cls):
-            merged_kwargs = dict(DEFAULT_DATACLASS_KWARGS)
-            merged_kwargs.update(dataclass_kwargs)
-            actual_cls = dataclass(**merged_kwargs)(actual_cls)
-        definition = _build_bundle_definition(actual_cls)
+            actual_cls = dataclass(**_merged_dataclass_kwargs(dataclass_kwargs))(
+                actual_cls
+            )
+        if _own_bundle_definition(actual_cls) is not None:
+            return actual_cls
+        definition = _inherited_bundle_definition(actual_cls)
+        if definition is None:
+            definition = _build_bundle_definition(actual_cls)
         setattr(actual_cls, "__bundle_definition__", definition)
         if not hasattr(actual_cls, "write"):
             setattr(actual_cls, "write", _bundle_write)
@@ -189,15 +291,23 @@ def twig(
     Works for both :class:`Dir` and :class:`File` annotations.
     """
 
+    if (
+        name is None
+        and extension is None
+        and prefix is None
+        and copyfile is None
+        and not field_kwargs
+    ):
+        return dataclass_field()
     metadata: Dict[str, Any] = {}
     if name is not None:
-        metadata["name"] = name
+        metadata[_KEY_NAME] = name
     if extension is not None:
-        metadata["extension"] = _normalize_extension_value(extension)
+        metadata[_KEY_EXTENSION] = _normalize_extension_value(extension)
     if prefix is not None:
-        metadata["prefix"] = prefix
+        metadata[_KEY_PREFIX] = prefix
     if copyfile is not None:
-        metadata["copyfile"] = bool(copyfile)
+        metadata[_KEY_COPYFILE] = bool(copyfile)
     return dataclass_field(metadata=metadata if metadata else None, **field_kwargs)
 
 
@@ -207,18 +317,101 @@ def _bundle_write(self, path: str | Path, overwrite: bool = False) -> None:
     write_bundle(self, path, overwrite=overwrite)
 
 
+_DEFAULT_DATACLASS_KWARGS_DICT: Dict[str, Any] = dict(DEFAULT_DATACLASS_KWARGS)
+
+
+def _merged_dataclass_kwargs(overrides: Mapping[str, Any]) -> Mapping[str, Any]:
+    if not overrides:
+        return _DEFAULT_DATACLASS_KWARGS_DICT
+    try:
+        return _merged_dataclass_kwargs_cached(tuple(sorted(overrides.items())))
+    except TypeError:  # unhashable override values
+        return {**DEFAULT_DATACLASS_KWARGS, **overrides}
+
+
+@lru_cache(maxsize=32)
+def _merged_dataclass_kwargs_cached(
+    items: Tuple[Tuple[str, Any], ...]
+) -> Mapping[str, Any]:
+    return {**DEFAULT_DATACLASS_KWARGS, **dict(items)}
+
+
+def _inherited_bundle_definition(cls: Type[Any]) -> BundleDefinition | None:
+    # A subclass that declares no fields of its own has exactly its bundle
+    # parent's fields, so the parent's parsed definition can be reused as is.
+    # Plain dataclasses in between may add fields, so the reuse only applies
+    # when the parent was parsed from this very dataclass field table.
+    if inspect.get_annotations(cls) or "__dataclass_fields__" in cls.__dict__:
+        return None
+    parent = getattr(cls, "__bundle_definition__", None)
+    if not isinstance(parent, BundleDefinition):
+        return None
+    if getattr(parent.cls, "__dataclass_fields__", None) is not getattr(
+        cls, "__dataclass_fields__", None
+    ):
+        return None
+    return replace(parent, cls=cls)
+
+
+def _own_bundle_definition(cls: Type[Any]) -> BundleDefinition | None:
+    # Only trust a definition stored on ``cls`` itself; subclasses inherit the
+    # attribute from their parent but need their own field tuple.
+    definition = cls.__dict__.get("__bundle_definition__")
+    if isinstance(definition, BundleDefinition) and definition.cls is cls:
+        return definition
+    return None
+
+
+def _memoize_annotation(func: Callable[..., _T]) -> Callable[..., _T]:
+    """Memoize ``func`` on its arguments, bypassing the cache for unhashable ones.
+
+    Annotations such as ``Annotated[File[str], {...}]`` may carry unhashable
+    extras; those are rare, so they simply skip the cache.
+    """
+
+    cached = lru_cache(maxsize=2048)(func)
+
+    @wraps(func)
+    def _wrapper(*args: Any) -> _T:
+        try:
+            hash(args)
+        except TypeError:
+            return func(*args)
+        return cached(*args)
+
+    _wrapper.cache_clear = cached.cache_clear  # type: ignore[attr-defined]
+    return _wrapper
+
+
 def _get_type_hints_with_extras(target: Type[Any]) -> Dict[str, Any]:
+    merged: Dict[str, Any] = {}
+    for base in reversed(target.__mro__[:-1]):
+        merged.update(inspect.get_annotations(base))
+    # Classes defined without ``from __future__ import annotations`` already
+    # hold evaluated annotations; only pay for ``get_type_hints`` when some
+    # hint still needs a forward reference resolved.
+    if not any(_has_forward_ref(value) for value in merged.values()):
+        return {
+            name: type(None) if value is None else value
+            for name, value in merged.items()
+        }
+    from typing import get_type_hints
+
     try:
         return get_type_hints(target, include_extras=True)
     except TypeError:
         return get_type_hints(target)
 
 
-def _freeze_metadata_map(metadata: Mapping[str, Any] | None) -> Mapping[str, Any]:
+def _has_forward_ref(annotation: Any) -> bool:
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    return any(_has_forward_ref(arg) for arg in get_args(annotation))
+
+
+def _copy_metadata_map(metadata: Mapping[str, Any] | None) -> Mapping[str, Any]:
     if not metadata:
-        return MappingProxyType({})
-    if isinstance(metadata, MappingProxyType):
-        return metadata
+        return _EMPTY_METADATA
     return MappingProxyType(dict(metadata))
 
 
@@ -227,20 +420,19 @@ def _build_bundle_definition(cls: Type[Any]) -> BundleDefinition:
     collected: list[BundleField] = []
     for dc_field in fields(cls):
         annotation = annotations.get(dc_field.name, dc_field.type)
-        kind = _classify_field(annotation, cls, dc_field.name)
-        raw_metadata = _freeze_metadata_map(dc_field.metadata)
+        info = _annotation_info(annotation)
+        kind, dir_payload_cls = _classify_field(info, cls, dc_field.name)
+        raw_metadata = _copy_metadata_map(dc_field.metadata)
         normalized_metadata = (
             _normalize_metadata(
-                annotation,
+                info,
                 raw_metadata,
                 infer_extension=(kind is FieldKind.FILE),
             )
             if kind in (FieldKind.DIR, FieldKind.FILE)
             else ()
         )
-        is_collection = (
-            kind is FieldKind.DIR and _dir_annotation_is_collection(annotation)
-        )
+        is_collection = kind is FieldKind.DIR and _dir_annotation_is_collection(info)
         collected.append(
             BundleField(
                 name=dc_field.name,
@@ -250,41 +442,41 @@ def _build_bundle_definition(cls: Type[Any]) -> BundleDefinition:
                 metadata=normalized_metadata,
                 raw_metadata=raw_metadata,
                 is_collection=is_collection,
+                dir_payload_cls=dir_payload_cls,
             )
         )
-    definition = BundleDefinition(cls=cls, fields=tuple(collected))
-    return definition
+    return BundleDefinition(cls=cls, fields=tuple(collected))
+
+
+def _index_metadata_by_layer(
+    metadata: Tuple[BundleMetadata, ...]
+) -> Mapping[Type[Any], Mapping[str, Any]]:
+    # The first entry for each layer wins, matching a linear scan.
+    indexed: Dict[Type[Any], Mapping[str, Any]] = {}
+    for entry in metadata:
+        indexed.setdefault(entry.layer, entry.data)
+    return MappingProxyType(indexed)
 
 
 def _ensure_instance_metadata_storage(cls: Type[Any]) -> None:
     original_init = cls.__init__
     if getattr(original_init, INIT_WRAPPED_ATTR, False):
         return
+    if INSTANCE_METADATA_ATTR not in cls.__dict__:
+        setattr(cls, INSTANCE_METADATA_ATTR, None)
 
     @wraps(original_init)
     def __bundle_init__(self, *args, **kwargs):  # type: ignore[override]
-        runtime_metadata = _extract_runtime_metadata(kwargs)
-        _set_instance_metadata(self, runtime_metadata)
+        runtime_metadata = kwargs.pop(RUNTIME_METADATA_KWARG, None)
+        # Store before running ``__init__`` so ``__post_init__`` can read it.
+        if runtime_metadata is not None:
+            object.__setattr__(self, INSTANCE_METADATA_ATTR, runtime_metadata)
         original_init(self, *args, **kwargs)
 
     setattr(__bundle_init__, INIT_WRAPPED_ATTR, True)
     cls.__init__ = __bundle_init__  # type: ignore[assignment]
 
 
-def _set_instance_metadata(instance: Any, metadata: Any) -> None:
-    payload = metadata if metadata is not None else {}
-    try:
-        setattr(instance, INSTANCE_METADATA_ATTR, payload)
-    except AttributeError:
-        object.__setattr__(instance, INSTANCE_METADATA_ATTR, payload)
-
-
-def _extract_runtime_metadata(kwargs: MutableMapping[str, Any]) -> Any:
-    if RUNTIME_METADATA_KWARG in kwargs:
-        return kwargs.pop(RUNTIME_METADATA_KWARG)
-    return None
-
-
 def _strip_annotated(annotation: Any) -> Any:
     current = annotation
     while Annotated is not None and get_origin(current) is Annotated:
@@ -295,88 +487,113 @@ def _strip_annotated(annotation: Any) -> Any:
     return current
 
 
-def _classify_field(annotation: Any, cls: Type[Any], field_name: str) -> FieldKind:
+@dataclass(frozen=True, slots=True, eq=False)
+class _AnnInfo:
+    """Field annotation with ``Annotated`` stripped and origin/args resolved once."""
+
+    raw: Any
+    base: Any
+    origin: Any
+    args: Tuple[Any, ...]
+
+
+@_memoize_annotation
+def _annotation_info(annotation: Any) -> _AnnInfo:
     base = _strip_annotated(annotation)
-    origin = get_origin(base)
-    if origin is Dir:
-        _validate_dir_annotation(base, cls, field_name)
-        return FieldKind.DIR
-    if origin is File:
-        _validate_file_annotation(base, cls, field_name)
-        return FieldKind.FILE
-    return FieldKind.VALUE
-
-
-def _validate_dir_annotation(annotation: Any, cls: Type[Any], field_name: str) -> None:
-    args = get_args(annotation)
-    if len(args) != 1:
+    return _AnnInfo(annotation, base, get_origin(base), get_args(base))
+
+
+def _classify_field(
+    info: _AnnInfo, cls: Type[Any], field_name: str
+) -> Tuple[FieldKind, Type[Any] | None]:
+    if info.origin is Dir:
+        return FieldKind.DIR, _validate_dir_annotation(info, cls, field_name)
+    if info.origin is File:
+        _validate_file_annotation(info, cls, field_name)
+        return FieldKind.FILE, None
+    return FieldKind.VALUE, None
+
+
+def _validate_dir_annotation(
+    info: _AnnInfo, cls: Type[Any], field_name: str
+) -> Type[Any]:
+    if len(info.args) != 1:
         raise InvalidBundleAnnotation(
             f"Dir annotation for field '{field_name}' on bundle '{cls.__name__}' requires exactly one argument."
         )
-    payload = _extract_dir_payload(args[0])
-    if payload is None or not _is_bundle_class(payload):
+    # Only the unwrapping is cached; the bundle check stays live so a class
+    # decorated after a failed lookup is still accepted.
+    payload = _extract_dir_payload(info.args[0])
+    if not _is_bundle_class(payload):
         raise InvalidBundleAnnotation(
             f"Dir annotation for field '{field_name}' on bundle '{cls.__name__}' must reference another "
             "@bundle-decorated class."
         )
+    return payload
 
 
-def _validate_file_annotation(annotation: Any, cls: Type[Any], field_name: str) -> None:
-    args = get_args(annotation)
-    if len(args) != 1:
+def _validate_file_annotation(info: _AnnInfo, cls: Type[Any], field_name: str) -> None:
+    if len(info.args) != 1:
         raise InvalidBundleAnnotation(
             f"File annotation for field '{field_name}' on bundle '{cls.__name__}' requires exactly one argument."
         )
-    payload = args[0]
-    if _contains_dir(payload):
+    if _file_payload_contains_dir(info):
         raise InvalidBundleAnnotation(
             f"File payload for field '{field_name}' on bundle '{cls.__name__}' cannot contain Dir[...] annotations."
         )
 
 
+@_memoize_annotation
+def _file_payload_contains_dir(info: _AnnInfo) -> bool:
+    payload = info.args[0]
+    return get_origin(payload) is not None and _contains_dir(payload)
+
+
 def _contains_dir(annotation: Any) -> bool:
-    origin = get_origin(annotation)
-    if origin is None:
-        return False
-    if origin is Dir:
-        return True
-    return any(_contains_dir(arg) for arg in get_args(annotation))
+    stack = [annotation]
+    while stack:
+        current = stack.pop()
+        origin = get_origin(current)
+        if origin is Dir:
+            return True
+        if origin is not None:
+            stack.extend(get_args(current))
+    return False
 
 
 def _is_bundle_class(candidate: Any) -> bool:
     return isinstance(candidate, type) and hasattr(candidate, "__bundle_definition__")
 
 
-_DIR_COLLECTION_ORIGINS: Tuple[Any, ...] = (
-    list,
-    tuple,
-    set,
-    frozenset,
-    abc.Sequence,
-    abc.MutableSequence,
-    abc.Set,
-    abc.Iterable,
+_DIR_COLLECTION_ORIGINS: frozenset[Any] = frozenset(
+    {
+        list,
+        tuple,
+        set,
+        frozenset,
+        abc.Sequence,
+        abc.MutableSequence,
+        abc.Set,
+        abc.Iterable,
+    }
 )
 
 
-def _extract_dir_payload(argument: Any) -> Type[Any] | None:
+@_memoize_annotation
+def _extract_dir_payload(argument: Any) -> Any:
     candidate = _strip_annotated(argument)
-    if _is_bundle_class(candidate):
-        return candidate
     origin = get_origin(candidate)
     if origin in _DIR_COLLECTION_ORIGINS:
         args = get_args(candidate)
         if not args:
             return None
-        inner = args[0]
-        if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
-            inner = args[0]
-        return _extract_dir_payload(inner)
-    return None
+        return _extract_dir_payload(args[0])
+    return candidate
 
 
-def _dir_annotation_is_collection(annotation: Any) -> bool:
-    args = get_args(_strip_annotated(annotation))
+@_memoize_annotation
+def _dir_annotation_is_collection(info: _AnnInfo) -> bool:
+    args = info.args
     if len(args) != 1:
         return False
     candidate = _strip_annotated(args[0])
@@ -386,13 +603,26 @@ def _dir_annotation_is_collection(annotation: Any) -> bool:
     return False
 
 
+_LAYER_KEYS: frozenset[Any] = frozenset({Dir, Dir.__name__, File, File.__name__})
+
+
 def _normalize_metadata(
-    annotation: Any,
+    info: _AnnInfo,
     metadata: Mapping[str, Any],
     *,
     infer_extension: bool = False,
 ) -> Tuple[BundleMetadata, ...]:
-    root_layer = _top_layer(annotation)
+    if not metadata:
+        return _default_metadata(info, infer_extension)
+    root_layer = _top_layer(info)
+    if _LAYER_KEYS.isdisjoint(metadata.keys()):
+        # Common case: only regular keys (no explicit Dir/File layers).
+        root_metadata = BundleMetadata(
+            layer=root_layer,
+            index=0,
+            data=_normalize_metadata_layer(root_layer, metadata),
+        )
+        return _maybe_attach_extension((root_metadata,), info, infer_extension)
     regular_keys: Dict[Any, Any] = {}
     layer_keys: Dict[Type[Any], Any] = {}
     for key, value in metadata.items():
@@ -413,7 +643,14 @@ def _normalize_metadata(
         )
     for layer, value in layer_keys.items():
         normalized.extend(_expand_layer_metadata(layer, value))
-    return _maybe_attach_extension(tuple(normalized), annotation, infer_extension)
+    return _maybe_attach_extension(tuple(normalized), info, infer_extension)
+
+
+@_memoize_annotation
+def _default_metadata(info: _AnnInfo, infer_extension: bool) -> Tuple[BundleMetadata, ...]:
+    # Fields without twig metadata normalize purely from their annotation, so
+    # every ``File[dict]`` etc. shares one (immutable) metadata tuple.
+    return _maybe_attach_extension((), info, infer_extension)
 
 
 def _register_layer(
@@ -426,32 +663,34 @@ def _register_layer(
     target[layer] = value
 
 
-def _expand_layer_metadata(layer: Type[Any], value: Any) -> Iterable[BundleMetadata]:
+def _expand_layer_metadata(layer: Type[Any], value: Any) -> list[BundleMetadata]:
     if isinstance(value, Mapping):
-        yield BundleMetadata(
-            layer=layer, index=0, data=_normalize_metadata_layer(layer, value)
-        )
-        return
+        return [
+            BundleMetadata(
+                layer=layer, index=0, data=_normalize_metadata_layer(layer, value)
+            )
+        ]
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+        expanded: list[BundleMetadata] = []
         for index, entry in enumerate(value):
             if not isinstance(entry, Mapping):
                 raise BundleMetadataError(
                     f"Layer metadata for {layer.__name__} must be mappings; got {type(entry).__name__}."
                 )
-            yield BundleMetadata(
-                layer=layer, index=index, data=_normalize_metadata_layer(layer, entry)
+            expanded.append(
+                BundleMetadata(
+                    layer=layer, index=index, data=_normalize_metadata_layer(layer, entry)
+                )
             )
-        return
+        return expanded
     raise BundleMetadataError(
         f"Layer metadata for {layer.__name__} must be a mapping or sequence of mappings; got {type(value).__name__}."
     )
 
 
-def _top_layer(annotation: Any) -> Type[Any]:
-    base = _strip_annotated(annotation)
-    origin = get_origin(base)
-    if origin in (Dir, File):
-        return origin
+def _top_layer(info: _AnnInfo) -> Type[Any]:
+    if info.origin in (Dir, File):
+        return info.origin
     raise InvalidBundleAnnotation("Top-level annotation must be Dir or File")
 
 
@@ -460,23 +699,25 @@ def _normalize_metadata_layer(
 ) -> Mapping[str, Any]:
     normalized: Dict[str, Any] = {}
     for key, value in data.items():
-        if key == "name":
-            hint = _normalize_hint_entry("name", value)
+        if key == _KEY_NAME:
+            hint = _normalize_hint_entry(_KEY_NAME, value)
             if hint is not None:
-                normalized["name"] = hint
+                normalized[_KEY_NAME] = hint
             continue
-        if key == "extension":
-            normalized["extension"] = _normalize_extension_value(value)
+        if key == _KEY_EXTENSION:
+            normalized[_KEY_EXTENSION] = _normalize_extension_value(value)
             continue
-        if key == "prefix":
-            hint = _normalize_hint_entry("prefix", value)
+        if key == _KEY_PREFIX:
+            hint = _normalize_hint_entry(_KEY_PREFIX, value)
             if hint is not None:
-                normalized["prefix"] = hint
+                normalized[_KEY_PREFIX] = hint
             continue
-        if key == "copyfile":
-            normalized["copyfile"] = bool(value)
+        if key == _KEY_COPYFILE:
+            normalized[_KEY_COPYFILE] = bool(value)
             continue
         normalized[key] = value
+    if not normalized:
+        return _EMPTY_METADATA
     return MappingProxyType(normalized)
 
 
@@ -513,25 +754,60 @@ def _normalize_hint_entry(entry_name: str, value: Any) -> Hint | None:
             raise BundleMetadataError(
                 f"Metadata entry '{entry_name}' cannot be an empty string."
             )
-        kind = (
-            HintKind.TEMPLATE
-            if ("{" in hint_value and "}" in hint_value)
-            else HintKind.LITERAL
-        )
-        return Hint(kind, hint_value, hint_source)
+        if "{" in hint_value:
+            try:
+                return _make_template_hint(hint_value, hint_source)
+            except ValueError as exc:
+                raise BundleMetadataError(
+                    f"Metadata entry '{entry_name}' has a malformed template {hint_value!r}: {exc}"
+                ) from exc
+        return _make_literal_hint(hint_value, hint_source)
     raise BundleMetadataError(
         f"Unsupported value for '{entry_name}' metadata entry."
     )
 
 
+# String hints are immutable and heavily repeated across schemas (``"data"``,
+# ``"{name}"``), so identical ones share a single Hint instance.
+@lru_cache(maxsize=512)
+def _make_literal_hint(value: str, source: str) -> Hint:
+    return Hint(HintKind.LITERAL, value, source)
+
+
+@lru_cache(maxsize=512)
+def _make_template_hint(value: str, source: str) -> Hint:
+    return Hint(HintKind.TEMPLATE, value, source, _compile_template(value))
+
+
+def _compile_template(value: str) -> Tuple[Tuple[str, str | None, str, str | None], ...] | None:
+    """Pre-parse ``value`` into ``(literal, field, spec, conversion)`` segments.
+
+    Returns ``None`` when the template uses positional, attribute or index
+    lookups, or nested format specs; those keep going through ``str.format``.
+    Raises :class:`ValueError` for malformed templates.
+    """
+
+    segments = []
+    simple = True
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(value):
+        if field_name is not None and (
+            not field_name.isidentifier()
+            or "{" in (format_spec or "")
+            or conversion not in (None, "r", "s", "a")
+        ):
+            simple = False
+        segments.append((literal, field_name, format_spec or "", conversion))
+    return tuple(segments) if simple else None
+
+
 def _maybe_attach_extension(
-    metadata: Tuple[BundleMetadata, ...], annotation: Any, infer_extension: bool
+    metadata: Tuple[BundleMetadata, ...], info: _AnnInfo, infer_extension: bool
 ) -> Tuple[BundleMetadata, ...]:
     if not infer_extension:
         return metadata
     if _metadata_has_extension(metadata):
         return metadata
-    inferred = _infer_extension_from_file_annotation(annotation)
+    inferred = _infer_extension_from_file_annotation(info)
     if not inferred:
         return metadata
     normalized_ext = _normalize_extension_value(inferred)
@@ -540,7 +816,7 @@ def _maybe_attach_extension(
         first = updated[0]
         if first.layer is File:
             merged = dict(first.data)
-            merged.setdefault("extension", normalized_ext)
+            merged.setdefault(_KEY_EXTENSION, normalized_ext)
             updated[0] = BundleMetadata(
                 layer=first.layer,
                 index=first.index,
@@ -552,7 +828,7 @@ def _maybe_attach_extension(
                 BundleMetadata(
                     layer=File,
                     index=0,
-                    data=MappingProxyType({"extension": normalized_ext}),
+                    data=_extension_metadata(normalized_ext),
                 ),
             )
         return tuple(updated)
@@ -560,29 +836,33 @@ def _maybe_attach_extension(
         BundleMetadata(
             layer=File,
             index=0,
-            data=MappingProxyType({"extension": normalized_ext}),
+            data=_extension_metadata(normalized_ext),
         ),
     )
 
 
+@lru_cache(maxsize=256)
+def _extension_metadata(extension: str) -> Mapping[str, Any]:
+    return MappingProxyType({_KEY_EXTENSION: extension})
+
+
 def _metadata_has_extension(metadata: Tuple[BundleMetadata, ...]) -> bool:
     for meta in metadata:
-        if meta.layer is File and "extension" in meta.data:
+        if meta.layer is File and _KEY_EXTENSION in meta.data:
             return True
     return False
 
 
-_TEXT_SCALAR_TYPES = (str, int, float)
-_LIST_ORIGINS: Tuple[Any, ...] = (list, abc.Sequence, abc.MutableSequence)
-_MAPPING_ORIGINS: Tuple[Any, ...] = (dict, abc.Mapping, abc.MutableMapping)
+_TEXT_SCALAR_TYPES: frozenset[Any] = frozenset({str, int, float})
+_LIST_ORIGINS: frozenset[Any] = frozenset({list, abc.Sequence, abc.MutableSequence})
+_MAPPING_ORIGINS: frozenset[Any] = frozenset({dict, abc.Mapping, abc.MutableMapping})
 
 
-def _infer_extension_from_file_annotation(annotation: Any) -> str | None:
-    base = _strip_annotated(annotation)
-    origin = get_origin(base)
-    if origin is not File:
+@_memoize_annotation
+def _infer_extension_from_file_annotation(info: _AnnInfo) -> str | None:
+    if info.origin is not File:
         return None
-    args = get_args(base)
+    args = info.args
     if not args:
         return None
     payload = args[0]
@@ -590,8 +870,22 @@ def _infer_extension_from_file_annotation(annotation: Any) -> str | None:
     return _normalize_extension_value(hinted) if hinted else None
 
 
+# Plain (non-generic) payload types resolve without walking the cascade below.
+_FAST_EXT_BY_TYPE: Mapping[Any, str | None] = {
+    str: "txt",
+    int: "txt",
+    float: "txt",
+    dict: "json",
+    abc.Mapping: "json",
+    abc.MutableMapping: "json",
+    list: None,
+}
+
+
 def _infer_extension_from_payload(payload: Any) -> str | None:
     payload = _strip_annotated(payload)
+    if isinstance(payload, type) and payload in _FAST_EXT_BY_TYPE:
+        return _FAST_EXT_BY_TYPE[payload]
     if _is_text_scalar(payload):
         return "txt"
     if _is_mapping_type(payload):
@@ -635,6 +929,7 @@ def _is_mapping_type(annotation: Any) -> bool:
     return origin in _MAPPING_ORIGINS if origin is not None else False
 
 
+@lru_cache(maxsize=256)
 def _normalize_extension_value(extension: str) -> str:
     ext = extension.strip()
     if not ext:
@@ -4,22 +4,35 @@ from __future__ import annotations
 
 import json
 import keyword
+import os
 import re
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, make_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Sequence,
+)
 
-from .dsl import Dir, File, bundle, twig
+from .dsl import _PARALLEL_IO_THRESHOLD, Dir, File, bundle, twig
 
 
 __all__ = ["InferredBundle", "infer_bundle_from_directory"]
 
 
 SUPPORTED_EXTENSIONS = {".txt", ".json", ".jsonl"}
+_SUPPORTED = frozenset(SUPPORTED_EXTENSIONS)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InferredBundle:
     """Container for dynamically inferred bundle information."""
 
@@ -42,23 +55,33 @@ def infer_bundle_from_directory(
 
     builder = _BundleBuilder(root_path, root_class_name)
     root_cls, instance = builder.build()
-    schema = builder.schema()
-    return InferredBundle(root_cls, instance, schema)
+    return InferredBundle(root_cls, instance, builder.schema())
 
 
 class _BundleBuilder:
     def __init__(self, root_path: Path, root_override: str | None) -> None:
         self.root_path = root_path
         self.root_override = root_override
+        self._root_str = str(root_path)
+        # Every scanned path starts with this prefix; os.path.join handles a
+        # filesystem-root directory that already ends with a separator.
+        self._root_prefix = os.path.join(self._root_str, "")
         self._class_cache: dict[Path, type[Any]] = {}
         self._instance_cache: dict[Path, Any] = {}
         self._schema_defs: dict[str, Mapping[str, Any]] = {}
         self._name_counts: MutableMapping[str, int] = defaultdict(int)
+        self._listings: dict[Path, list[_Entry]] = {}
+        self._payloads: dict[Path, Any] = {}
+        self._struct_classes: dict[Hashable, type[Any]] = {}
+        self._struct_bases: dict[type[Any], type[Any]] = {}
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
     def build(self) -> tuple[type[Any], Any]:
+        # Scan and read first so file I/O can overlap across the whole tree;
+        # class construction stays serial to keep generated names stable.
+        self._payloads = _read_payloads(self._scan(self.root_path))
         return self._build_dir(self.root_path, preferred_name=self.root_override)
 
     def schema(self) -> Mapping[str, Any]:
@@ -73,6 +96,37 @@ class _BundleBuilder:
     # ------------------------------------------------------------------
     # Builders
     # ------------------------------------------------------------------
+    def _scan(self, root: Path) -> list[tuple[Path, str]]:
+        files: list[tuple[Path, str]] = []
+        pending = [root]
+        while pending:
+            path = pending.pop()
+            # DirEntry caches the d_type from the directory read, so the
+            # is_dir/is_file checks avoid a stat per entry (symlinks still
+            # resolve).
+            with os.scandir(path) as scanner:
+                dir_entries = sorted(scanner, key=lambda e: (e.is_file(), e.name))
+            # Names are split once here; _build_dir reuses the parts.
+            listing: list[_Entry] = []
+            for entry in dir_entries:
+                name = entry.name
+                if entry.is_dir():
+                    entry_path = path / name
+                    pending.append(entry_path)
+                    listing.append(_Entry(name, entry_path, name, ""))
+                elif entry.is_file():
+                    stem, raw_suffix = _split_suffix(name)
+                    suffix = raw_suffix.lower()
+                    entry_path = path / name
+                    if suffix not in _SUPPORTED:
+                        raise ValueError(
+                            f"Unsupported file extension '{raw_suffix}' in '{entry_path}'."
+                        )
+                    listing.append(_Entry(name, entry_path, stem, suffix))
+                    files.append((entry_path, suffix))
+            self._listings[path] = listing
+        return files
+
     def _build_dir(
         self, path: Path, *, preferred_name: str | None = None
     ) -> tuple[type[Any], Any]:
@@ -84,106 +138,108 @@ class _BundleBuilder:
             trust_input=preferred_name is not None,
         )
 
-        entries = sorted(path.iterdir(), key=lambda p: (p.is_file(), p.name))
+        entries = self._listings[path]
         fields: list[tuple[str, Any, Any]] = []
         init_kwargs: dict[str, Any] = {}
         schema_properties: dict[str, Any] = {}
-        required_fields: list[str] = []
+        struct_key: list[Hashable] = []
 
         used_field_names: set[str] = set()
 
-        for entry in entries:
-            if entry.is_dir():
-                child_cls, child_instance = self._build_dir(entry)
+        for entry_name, entry_path, stem, suffix in entries:
+            if not suffix:
+                child_cls, child_instance = self._build_dir(entry_path)
+                # Annotate with the child's shared base: isomorphic siblings
+                # reuse this field, and each holds its own child subclass.
+                child_base = self._struct_bases[child_cls]
                 field_name = _unique_field_name(
-                    used_field_names, _snake_case(entry.name)
+                    used_field_names, _snake_case(entry_name)
                 )
                 fields.append(
                     (
                         field_name,
-                        Dir[child_cls],
-                        twig(name=entry.name),
+                        Dir[child_base],
+                        twig(name=entry_name),
                     )
                 )
                 init_kwargs[field_name] = child_instance
+                struct_key.append(("dir", field_name, entry_name, child_base))
                 schema_properties[field_name] = {
                     "$ref": f"#/$defs/{child_cls.__name__}",
-                    "description": f"Directory '{entry.name}'",
+                    "description": f"Directory '{entry_name}'",
                     "x-pyarty": {
                         "kind": "dir",
-                        "path": self._relative(entry),
-                        "name": entry.name,
+                        "path": self._relative(entry_path),
+                        "name": entry_name,
                     },
                 }
-                required_fields.append(field_name)
                 continue
 
-            if entry.is_file():
-                suffix = entry.suffix.lower()
-                if suffix not in SUPPORTED_EXTENSIONS:
-                    raise ValueError(
-                        f"Unsupported file extension '{entry.suffix}' in '{entry}'."
-                    )
-                annotation, value, schema = self._build_file(entry)
-                field_name = _unique_field_name(
-                    used_field_names, _snake_case(entry.stem)
-                )
-                fields.append(
-                    (
-                        field_name,
-                        annotation,
-                        twig(name=entry.stem, extension=suffix.lstrip(".")),
-                    )
+            value = self._payloads[entry_path]
+            annotation = self._file_annotation(suffix, value)
+            field_name = _unique_field_name(used_field_names, _snake_case(stem))
+            fields.append(
+                (
+                    field_name,
+                    annotation,
+                    twig(name=stem, extension=suffix[1:]),
                 )
-                init_kwargs[field_name] = value
-                schema["x-pyarty"] = {
-                    "kind": "file",
-                    "path": self._relative(entry),
-                    "name": entry.name,
-                    "extension": suffix.lstrip("."),
-                }
-                schema_properties[field_name] = schema
-                required_fields.append(field_name)
-
-        namespace = {"__module__": __name__}
-        dataclass_type = make_dataclass(class_name, fields, namespace=namespace)
-        bundle_class = bundle(dataclass_type)
+            )
+            init_kwargs[field_name] = value
+            struct_key.append(("file", field_name, stem, suffix, annotation))
+            schema = self._file_schema(suffix, value)
+            schema["x-pyarty"] = {
+                "kind": "file",
+                "path": self._relative(entry_path),
+                "name": entry_name,
+                "extension": suffix[1:],
+            }
+            schema_properties[field_name] = schema
+
+        key = tuple(struct_key)
+        base_class = self._struct_classes.get(key)
+        if base_class is None:
+            namespace = {"__module__": __name__}
+            dataclass_type = make_dataclass(f"_{class_name}Base", fields, namespace=namespace)
+            base_class = bundle(dataclass_type)
+            self._struct_classes[key] = base_class
+        # Every directory gets a named subclass of the hidden base shared by
+        # its isomorphic siblings, so the generated dataclass and parsed bundle
+        # fields are reused while class names and schema $defs stay per
+        # directory, and no directory's class subclasses a sibling's.
+        bundle_class = bundle(
+            type(class_name, (base_class,), {"__module__": __name__})
+        )
+        self._struct_bases[bundle_class] = base_class
         instance = bundle_class(**init_kwargs)
 
         self._class_cache[path] = bundle_class
         self._instance_cache[path] = instance
         self._schema_defs[bundle_class.__name__] = self._directory_schema(
-            bundle_class.__name__, schema_properties, required_fields, path
+            bundle_class.__name__, schema_properties, path
         )
         return bundle_class, instance
 
-    def _build_file(self, path: Path) -> tuple[Any, Any, Dict[str, Any]]:
-        suffix = path.suffix.lower()
+    def _file_annotation(self, suffix: str, payload: Any) -> Any:
+        if suffix == ".txt":
+            return File[str]
+        if suffix == ".json":
+            return File[self._annotation_for_json_value(payload)]
+        if suffix == ".jsonl":
+            return File[List[self._annotation_for_jsonl(payload)]]
+        raise ValueError(f"Unsupported file extension '{suffix}'.")
+
+    def _file_schema(self, suffix: str, payload: Any) -> Dict[str, Any]:
         if suffix == ".txt":
-            contents = path.read_text(encoding="utf-8")
-            return File[str], contents, {"type": "string"}
+            return {"type": "string"}
         if suffix == ".json":
-            payload = json.loads(path.read_text(encoding="utf-8"))
-            annotation = File[self._annotation_for_json_value(payload)]
-            schema = _infer_json_schema(payload)
-            return annotation, payload, schema
+            return self._schema_for_shape(_shape_key(payload))
         if suffix == ".jsonl":
-            payload_list: list[Any] = []
-            with path.open("r", encoding="utf-8") as handle:
-                for line in handle:
-                    stripped = line.rstrip("\n\r")
-                    if not stripped:
-                        continue
-                    payload_list.append(json.loads(stripped))
-            annotation = File[List[self._annotation_for_jsonl(payload_list)]]
-            schema = {
+            return {
                 "type": "array",
-                "items": _merge_schemas(
-                    _infer_json_schema(entry) for entry in payload_list
-                ),
+                "items": self._merged_schema(_unique_shapes(payload)),
             }
-            return annotation, payload_list, schema
-        raise ValueError(f"Unsupported file extension '{path.suffix}'.")
+        raise ValueError(f"Unsupported file extension '{suffix}'.")
 
     # ------------------------------------------------------------------
     # Helpers
@@ -199,16 +255,18 @@ class _BundleBuilder:
         return f"{sanitized}{count+1}"
 
     def _relative(self, target: Path) -> str:
-        rel = target.relative_to(self.root_path)
-        rel_str = rel.as_posix()
-        return rel_str if rel_str else "."
+        target_str = str(target)
+        prefix = self._root_prefix
+        if target_str.startswith(prefix):
+            rel = target_str[len(prefix):]
+        else:
+            rel = os.path.relpath(target_str, self._root_str)
+        if os.sep != "/":
+            rel = rel.replace(os.sep, "/")
+        return rel or "."
 
     def _directory_schema(
-        self,
-        class_name: str,
-        properties: Mapping[str, Any],
-        required: Sequence[str],
-        path: Path,
+        self, class_name: str, properties: Dict[str, Any], path: Path
     ) -> Mapping[str, Any]:
         schema: Dict[str, Any] = {
             "title": class_name,
@@ -221,92 +279,155 @@ class _BundleBuilder:
                 "name": path.name or "root",
             },
         }
-        if required:
-            schema["required"] = list(required)
+        if properties:
+            schema["required"] = list(properties)
+        return schema
+
+    def _schema_for_shape(self, shape: Hashable) -> Dict[str, Any]:
+        # Shape keys already collapse uniform JSONL records, so this runs once
+        # per distinct record shape. Every node gets a fresh dict so emitted
+        # schema trees never alias each other.
+        if isinstance(shape, str):
+            return {"type": shape}
+        if shape[0] == "array":
+            schema: Dict[str, Any] = {"type": "array"}
+            if shape[1]:
+                schema["items"] = self._merged_schema(shape[1])
+            return schema
+        schema = {"type": "object"}
+        if shape[1]:
+            properties = {
+                key: self._schema_for_shape(inner) for key, inner in shape[1]
+            }
+            schema["properties"] = properties
+            schema["required"] = list(properties)
         return schema
 
+    def _merged_schema(self, shapes: Sequence[Hashable]) -> Dict[str, Any]:
+        if not shapes:
+            return {}
+        if len(shapes) == 1:
+            return self._schema_for_shape(shapes[0])
+        return {"anyOf": [self._schema_for_shape(shape) for shape in shapes]}
+
     def _annotation_for_json_value(self, value: Any) -> Any:
-        if isinstance(value, dict):
-            return Dict[str, Any]
-        if isinstance(value, list):
-            return List[Any]
-        if isinstance(value, bool):
-            return bool
-        if isinstance(value, int):
-            return int
-        if isinstance(value, float):
-            return float
-        if value is None:
-            return Any
-        return str
+        return _JSON_ANNOTATION.get(type(value), str)
 
     def _annotation_for_jsonl(self, items: list[Any]) -> Any:
         if not items:
             return Dict[str, Any]
-        first = items[0]
-        if isinstance(first, dict):
-            return Dict[str, Any]
-        if isinstance(first, list):
-            return List[Any]
-        if isinstance(first, bool):
-            return bool
-        if isinstance(first, int):
-            return int
-        if isinstance(first, float):
-            return float
-        if first is None:
-            return Any
-        return str
-
-
-def _merge_schemas(schemas: Iterable[Mapping[str, Any]]) -> Mapping[str, Any]:
-    unique: list[Mapping[str, Any]] = []
-    signatures: set[str] = set()
-    for schema in schemas:
-        key = json.dumps(schema, sort_keys=True)
-        if key in signatures:
-            continue
-        signatures.add(key)
-        unique.append(schema)
-    if not unique:
-        return {}
-    if len(unique) == 1:
-        return unique[0]
-    return {"anyOf": unique}
-
-
-def _infer_json_schema(value: Any) -> Dict[str, Any]:
-    if value is None:
-        return {"type": "null"}
-    if isinstance(value, bool):
-        return {"type": "boolean"}
-    if isinstance(value, int) and not isinstance(value, bool):
-        return {"type": "integer"}
-    if isinstance(value, float):
-        return {"type": "number"}
-    if isinstance(value, str):
-        return {"type": "string"}
-    if isinstance(value, list):
-        schema: Dict[str, Any] = {"type": "array"}
-        if value:
-            schema["items"] = _merge_schemas(
-                _infer_json_schema(entry) for entry in value
-            )
-        return schema
-    if isinstance(value, dict):
-        properties = {
-            key: _infer_json_schema(inner) for key, inner in sorted(value.items())
-        }
-        schema = {"type": "object"}
-        if properties:
-            schema["properties"] = properties
-            schema["required"] = list(properties.keys())
-        return schema
-    return {"type": "string"}
+        return _JSON_ANNOTATION.get(type(items[0]), str)
+
+
+class _Entry(NamedTuple):
+    """A scanned directory entry; ``suffix`` is empty for subdirectories."""
+
+    name: str
+    path: Path
+    stem: str
+    suffix: str
+
+
+def _read_payloads(files: Sequence[tuple[Path, str]]) -> dict[Path, Any]:
+    if len(files) < _PARALLEL_IO_THRESHOLD:
+        return {path: _read_payload(path, suffix) for path, suffix in files}
+    with ThreadPoolExecutor() as executor:
+        payloads = executor.map(lambda item: _read_payload(*item), files)
+        return {path: payload for (path, _), payload in zip(files, payloads)}
+
+
+def _read_payload(path: Path, suffix: str) -> Any:
+    if suffix == ".txt":
+        return path.read_text(encoding="utf-8")
+    if suffix == ".json":
+        return json.loads(path.read_bytes())
+    if suffix == ".jsonl":
+        # Decode the whole file once and parse lines as str; json.loads
+        # tolerates the trailing "\r" of CRLF line endings.
+        text = path.read_bytes().decode("utf-8")
+        loads = json.loads
+        return [loads(line) for line in text.split("\n") if line.strip()]
+    raise ValueError(f"Unsupported file extension '{suffix}'.")
+
+
+# json.loads only produces these exact types, so dispatch on type(value) is
+# equivalent to the isinstance chain (bool needs no special-casing before int).
+_JSON_ANNOTATION: Mapping[type, Any] = {
+    dict: Dict[str, Any],
+    list: List[Any],
+    bool: bool,
+    int: int,
+    float: float,
+    type(None): Any,
+    str: str,
+}
+
+# Shape keys of the JSON scalar types.
+_SCALAR_SHAPES: Mapping[type, str] = {
+    type(None): "null",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+}
+
+
+def _shape_key(value: Any) -> Hashable:
+    """Hashable description of ``value``'s JSON shape.
+
+    Scalars map to their JSON Schema type name; arrays and objects to tuples of
+    their (deduplicated, ordered) member shapes. Equal keys yield equal schemas.
+    """
+
+    kind = type(value)
+    scalar = _SCALAR_SHAPES.get(kind)
+    if scalar is not None:
+        return scalar
+    if kind is list:
+        return ("array", _unique_shapes(value))
+    if kind is dict:
+        return (
+            "object",
+            tuple((key, _shape_key(value[key])) for key in _sorted_keys(tuple(value))),
+        )
+    return "string"
+
+
+@lru_cache(maxsize=2048)
+def _sorted_keys(keys: tuple[str, ...]) -> tuple[str, ...]:
+    # Records in a JSONL file usually share one key layout; sort it once.
+    return tuple(sorted(keys))
+
+
+def _unique_shapes(values: Sequence[Any]) -> tuple[Hashable, ...]:
+    # Arrays of a single scalar type (the common case for large numeric or
+    # string arrays) are classified with one C-level pass over their types.
+    if values:
+        kinds = set(map(type, values))
+        if len(kinds) == 1:
+            scalar = _SCALAR_SHAPES.get(kinds.pop())
+            if scalar is not None:
+                return (scalar,)
+    return tuple(dict.fromkeys(map(_shape_key, values)))
+
+
+def _split_suffix(name: str) -> tuple[str, str]:
+    """Split ``name`` into ``(stem, suffix)`` with :attr:`Path.suffix` semantics."""
+
+    index = name.rfind(".")
+    if 0 < index < len(name) - 1:
+        return name[:index], name[index:]
+    return name, ""
+
+
+_NON_ALNUM = re.compile(r"[^0-9a-zA-Z]+")
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_KEYWORDS = frozenset(keyword.kwlist)
 
 
+@lru_cache(maxsize=4096)
 def _camelcase(value: str) -> str:
-    tokens = re.split(r"[^0-9a-zA-Z]+", value)
+    tokens = _NON_ALNUM.split(value)
     filtered = [token for token in tokens if token]
     if not filtered:
         return "Node"
@@ -316,10 +437,11 @@ def _camelcase(value: str) -> str:
     return combined
 
 
+@lru_cache(maxsize=4096)
 def _sanitize_class_name(value: str) -> str:
     if not value:
         return "Node"
-    filtered = re.sub(r"[^0-9a-zA-Z]+", "", value)
+    filtered = _NON_ALNUM.sub("", value)
     if not filtered:
         filtered = "Node"
     if filtered[0].isdigit():
@@ -327,14 +449,15 @@ def _sanitize_class_name(value: str) -> str:
     return filtered
 
 
+@lru_cache(maxsize=4096)
 def _snake_case(value: str) -> str:
-    value = re.sub(r"[^0-9a-zA-Z]+", "_", value).strip("_")
-    value = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", value)
+    value = _NON_ALNUM.sub("_", value).strip("_")
+    value = _CAMEL_BOUNDARY.sub(r"\1_\2", value)
     lowered = value.lower() or "node"
     if lowered[0].isdigit():
         lowered = f"n_{lowered}"
-    if keyword.iskeyword(lowered):
-        lowered = f"{lowered}_" 
+    if lowered in _KEYWORDS:
+        lowered = f"{lowered}_"
     return lowered
 
 
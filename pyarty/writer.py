@@ -2,23 +2,25 @@ from __future__ import annotations
 
 import inspect
 import json
-import shutil
+import os
 import warnings
+from operator import attrgetter
 from os import PathLike
-from pathlib import Path
-from typing import Any, Callable, Iterable, Mapping, Type
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Sequence
 
 from .dsl import (
     BundleDefinition,
     BundleField,
-    BundleMetadata,
     FieldKind,
-    File,
-    Dir,
     Hint,
     HintKind,
+    _KEY_EXTENSION,
+    _PARALLEL_IO_THRESHOLD,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - annotation only
+    from pathlib import Path
+
 
 class RenderError(RuntimeError):
     """Raised when a bundle cannot be rendered to disk."""
@@ -29,154 +31,330 @@ def write_bundle(
 ) -> None:
     """Render a bundle instance to ``output_path``."""
 
-    path = Path(output_path)
-    if path.exists():
-        if not overwrite and any(path.iterdir()):
+    path = os.fspath(output_path) or os.curdir
+    if os.path.exists(path):
+        if not overwrite and _has_entries(path):
             raise RenderError(f"Destination '{path}' already exists and is not empty.")
     else:
-        path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
 
     definition = getattr(bundle.__class__, "__bundle_definition__", None)
     if definition is None or not isinstance(definition, BundleDefinition):
         raise RenderError("Object is not a bundle-decorated dataclass instance.")
 
-    _render_fields(definition, bundle, path)
+    # Plan with plain string paths (os.path.join is much cheaper than building
+    # a Path object per node), then touch the filesystem in one pass.
+    plan = _RenderPlan()
+    _renderer_for(definition)(bundle, path, plan)
+    _make_leaf_dirs(plan.dirs)
+    _emit_files(plan.files)
 
 
-def _render_fields(
-    definition: BundleDefinition, instance: Any, base_path: Path
-) -> None:
-    for field in definition.fields:
-        value = getattr(instance, field.name)
-        if value is None:
-            continue
-        if field.kind is FieldKind.DIR:
-            _render_dir_field(field, value, instance, base_path)
-        elif field.kind is FieldKind.FILE:
-            _render_file_field(field, value, instance, base_path)
-        # VALUE fields are metadata-only and skipped.
+def _has_entries(path: str) -> bool:
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
 
 
-def _render_dir_field(
-    field: BundleField, value: Any, owner: Any, base_path: Path
-) -> None:
-    entries = _iter_dir_entries(value)
-    if not entries:
-        return
+class _RenderPlan:
+    """Directories and file writes collected by a renderer, in render order."""
+
+    __slots__ = ("dirs", "files")
+
+    def __init__(self) -> None:
+        self.dirs: list[str] = []
+        self.files: list[_PlannedFile] = []
+
+
+# (target, payload, extension, copyfile flag, copyfile source)
+_PlannedFile = tuple[str, Any, "str | None", bool, "str | None"]
+_Renderer = Callable[[Any, str, _RenderPlan], None]
+_Emitter = Callable[[Any, str, _RenderPlan], None]
+_Namer = Callable[[Any, Any, "int | None"], str]
+_HintResolver = Callable[[Any, Any, "int | None"], "str | None"]
+# A hint bound to its kind, called with the chosen context and index.
+_ContextResolver = Callable[[Any, "int | None"], str]
+
 
-    for index, child in entries:
-        name = _compute_name(field, owner, child, index)
-        dir_path = base_path / name
-        dir_path.mkdir(parents=True, exist_ok=True)
+def _renderer_for(definition: BundleDefinition) -> _Renderer:
+    """Return the specialized renderer for ``definition``, building it once.
+
+    The renderer is cached on the bundle class together with the field tuple
+    it was built from; definitions are immutable once the decorator has run,
+    and subclasses sharing their parent's fields reuse its renderer.
+    """
+
+    cls = definition.cls
+    cached = getattr(cls, "__bundle_renderer__", None)
+    if cached is not None and cached[0] is definition.fields:
+        return cached[1]
+    renderer = _compile_renderer(definition)
+    setattr(cls, "__bundle_renderer__", (definition.fields, renderer))
+    return renderer
+
+
+def _compile_renderer(definition: BundleDefinition) -> _Renderer:
+    # VALUE fields are metadata-only and never rendered; the rest render in
+    # declaration order. Each emitter fetches its own field value and skips
+    # it when None.
+    emitters: tuple[_Emitter, ...] = tuple(
+        _compile_dir_emitter(field)
+        if field.kind is FieldKind.DIR
+        else _compile_file_emitter(field)
+        for field in definition.fields
+        if field.kind is not FieldKind.VALUE
+    )
+
+    def render(instance: Any, base_path: str, plan: _RenderPlan) -> None:
+        for emit in emitters:
+            emit(instance, base_path, plan)
+
+    return render
+
+
+def _compile_dir_emitter(field: BundleField) -> _Emitter:
+    get_value = attrgetter(field.name)
+    namer = _compile_namer(field)
+    field_name = field.name
+    join = os.path.join
+
+    def emit_child(
+        owner: Any, child: Any, index: int | None, base_path: str, plan: _RenderPlan
+    ) -> None:
+        dir_path = join(base_path, namer(owner, child, index))
+        plan.dirs.append(dir_path)
         child_def = getattr(child.__class__, "__bundle_definition__", None)
         if child_def is None:
             raise RenderError(
-                f"Directory field '{field.name}' expected bundle data; got {type(child).__name__}."
+                f"Directory field '{field_name}' expected bundle data; got {type(child).__name__}."
             )
-        _render_fields(child_def, child, dir_path)
+        _renderer_for(child_def)(child, dir_path, plan)
+
+    def emit(owner: Any, base_path: str, plan: _RenderPlan) -> None:
+        value = get_value(owner)
+        if value is None:
+            return
+        if isinstance(value, Iterable) and not isinstance(value, _SCALAR_SEQUENCES):
+            for index, child in enumerate(value):
+                emit_child(owner, child, index, base_path, plan)
+        else:
+            emit_child(owner, value, None, base_path, plan)
+
+    return emit
 
 
-def _render_file_field(
-    field: BundleField, value: Any, owner: Any, base_path: Path
+def _compile_file_emitter(field: BundleField) -> _Emitter:
+    get_value = attrgetter(field.name)
+    namer = _compile_namer(field)
+    field_name = field.name
+    default_extension = field.extension
+    explicit_extension = _KEY_EXTENSION in field.raw_metadata
+    copyfile_flag = field.copyfile
+
+    def emit(owner: Any, base_path: str, plan: _RenderPlan) -> None:
+        value = get_value(owner)
+        if value is None:
+            return
+        extension = default_extension
+        name = namer(owner, value, None)
+        if not name:
+            raise RenderError(f"File field '{field_name}' produced an empty name.")
+        filename = name
+        source_path: str | None = None
+        if copyfile_flag:
+            source_path = _pathlike_or_none(value)
+            inferred_ext = _infer_extension_from_source(source_path)
+            if inferred_ext and not explicit_extension:
+                extension = inferred_ext
+        if extension:
+            filename = f"{filename}.{extension}"
+        target = os.path.join(base_path, filename)
+        # base_path is planned already (or is the output root); only names
+        # carrying a prefix/subpath need extra directories.
+        if _has_path_separator(filename):
+            plan.dirs.append(os.path.dirname(target))
+        plan.files.append((target, value, extension, copyfile_flag, source_path))
+
+    return emit
+
+
+def _make_leaf_dirs(dirs: Iterable[str]) -> None:
+    """Create every planned directory with one ``makedirs`` per leaf.
+
+    A directory that is the parent of another planned directory is created
+    implicitly by the child's ``makedirs``.
+    """
+
+    unique = dict.fromkeys(dirs)
+    parents = {os.path.dirname(path) for path in unique}
+    for path in unique:
+        if path not in parents:
+            os.makedirs(path, exist_ok=True)
+
+
+def _emit_files(files: Sequence[_PlannedFile]) -> None:
+    # Writes to distinct files are independent and release the GIL during
+    # I/O. Repeated targets keep their serial last-write-wins order.
+    if len(files) < _PARALLEL_IO_THRESHOLD or len(
+        {planned[0] for planned in files}
+    ) != len(files):
+        for planned in files:
+            _emit_file(*planned)
+        return
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as executor:
+        # Drain the results so the first worker exception propagates.
+        for _ in executor.map(lambda planned: _emit_file(*planned), files):
+            pass
+
+
+def _emit_file(
+    target: str,
+    payload: Any,
+    extension: str | None,
+    copyfile: bool,
+    source_path: str | None,
 ) -> None:
-    metadata = _metadata_for_layer(field.metadata, layer_type=File)
-    extension = metadata.get("extension")
-    explicit_extension = "extension" in field.raw_metadata
-    copyfile_flag = bool(metadata.get("copyfile"))
-    name = _compute_name(field, owner, value, None)
-    if not name:
-        raise RenderError(f"File field '{field.name}' produced an empty name.")
-    filename = name
-    source_path: Path | None = None
-    if copyfile_flag:
-        source_path = _pathlike_or_none(value)
-        inferred_ext = _infer_extension_from_source(source_path)
-        if inferred_ext and not explicit_extension:
-            extension = inferred_ext
-    if extension:
-        filename = f"{filename}.{extension}"
-    target = base_path / filename
-    target.parent.mkdir(parents=True, exist_ok=True)
-    if copyfile_flag and _copy_file_payload(source_path, target):
+    if copyfile and _copy_file_payload(source_path, target):
         return
-    _write_payload(target, value, extension)
-
-
-def _iter_dir_entries(value: Any) -> list[tuple[int | None, Any]]:
-    if value is None:
-        return []
-    if isinstance(value, Iterable) and not isinstance(value, (str, bytes, bytearray)):
-        entries: list[tuple[int | None, Any]] = []
-        for idx, item in enumerate(value):
-            entries.append((idx, item))
-        return entries
-    return [(None, value)]
-
-
-def _metadata_for_layer(
-    metadata: tuple[BundleMetadata, ...], layer_type: Type[Any]
-) -> Mapping[str, Any]:
-    for entry in metadata:
-        if entry.layer is layer_type:
-            return entry.data
-    return {}
-
-
-def _compute_name(
-    field: BundleField, owner: Any, subject: Any, index: int | None
-) -> str:
-    layer = Dir if field.kind is FieldKind.DIR else File
-    metadata = _metadata_for_layer(field.metadata, layer)
-    name_hint = metadata.get("name")
-    name = _resolve_hint(name_hint, owner, subject, index, field.name)
-    if name is None:
-        if field.kind is FieldKind.DIR and field.is_collection and index is not None:
-            name = field.name
-        else:
-            name = _default_name(field.name, index)
-    prefix_hint = metadata.get("prefix")
-    if prefix_hint:
-        prefix_value = _resolve_hint(prefix_hint, owner, subject, index, field.name)
-        if prefix_value:
-            return _apply_prefix(prefix_value, name)
-    return name
-
-
-def _resolve_hint(
-    hint: Hint | None,
-    owner: Any,
-    subject: Any,
-    index: int | None,
-    field_name: str,
-) -> str | None:
+    _write_payload(target, payload, extension)
+
+
+_PATH_SEPARATORS = tuple(dict.fromkeys(sep for sep in ("/", os.sep, os.altsep) if sep))
+
+
+def _has_path_separator(name: str) -> bool:
+    return any(sep in name for sep in _PATH_SEPARATORS)
+
+
+# Iterable values that still count as a single Dir payload.
+_SCALAR_SEQUENCES = (str, bytes, bytearray)
+
+
+def _compile_namer(field: BundleField) -> _Namer:
+    """Pre-resolve the name/prefix hints of ``field`` into a naming function."""
+
+    field_name = field.name
+    collection_dir = field.kind is FieldKind.DIR and field.is_collection
+    resolve_name = _compile_hint(field.name_hint, field_name)
+    resolve_prefix = _compile_hint(field.prefix_hint, field_name)
+
+    def namer(owner: Any, subject: Any, index: int | None) -> str:
+        name = (
+            resolve_name(owner, subject, index) if resolve_name is not None else None
+        )
+        if name is None:
+            if collection_dir and index is not None:
+                name = field_name
+            else:
+                name = _default_name(field_name, index)
+        if resolve_prefix is not None:
+            prefix_value = resolve_prefix(owner, subject, index)
+            if prefix_value:
+                return _apply_prefix(prefix_value, name)
+        return name
+
+    return namer
+
+
+def _compile_hint(hint: Hint | None, field_name: str) -> _HintResolver | None:
+    """Bind ``hint`` to its resolver and context source once per field."""
+
     if hint is None:
         return None
-    context = owner if hint.source == "self" else subject
-    if hint.kind is HintKind.LITERAL:
-        return str(hint.value)
-    if hint.kind is HintKind.TEMPLATE:
-        context_mapping = dict(_context_from(context))
-        if index is not None:
-            context_mapping.setdefault("index", index)
+    compiler = _HINT_COMPILERS.get(hint.kind)
+    if compiler is None:
+        raise RenderError(f"Unsupported hint kind for field '{field_name}'.")
+    resolve = compiler(hint, field_name)
+    if hint.source == "self":
+        return lambda owner, subject, index: resolve(owner, index)
+    return lambda owner, subject, index: resolve(subject, index)
+
+
+def _compile_literal(hint: Hint, field_name: str) -> _ContextResolver:
+    literal = str(hint.value)
+    return lambda context, index: literal
+
+
+def _compile_template(hint: Hint, field_name: str) -> _ContextResolver:
+    def resolve(context: Any, index: int | None) -> str:
         try:
-            return hint.value.format(**context_mapping)
+            return _format_template(hint, _TemplateContext(context, index))
         except KeyError as exc:
             raise RenderError(
                 f"Missing template variable {exc.args[0]!r} for field '{field_name}'."
             ) from exc
-    if hint.kind is HintKind.CALLABLE:
-        return _invoke_hint_callable(hint.value, context, index)
-    raise RenderError(f"Unsupported hint kind for field '{field_name}'.")
 
+    return resolve
+
+
+def _compile_callable(hint: Hint, field_name: str) -> _ContextResolver:
+    return _adapt_hint_callable(hint.value)
+
+
+_HINT_COMPILERS: Mapping[HintKind, Callable[[Hint, str], _ContextResolver]] = {
+    HintKind.LITERAL: _compile_literal,
+    HintKind.TEMPLATE: _compile_template,
+    HintKind.CALLABLE: _compile_callable,
+}
 
-def _context_from(source: Any) -> Mapping[str, Any]:
-    if source is None:
-        return {}
-    if isinstance(source, Mapping):
-        return source
-    if hasattr(source, "__dict__"):
-        return vars(source)
-    return {}
+
+_CONVERSIONS: Mapping[str, Callable[[Any], str]] = {"r": repr, "s": str, "a": ascii}
+
+
+def _format_template(hint: Hint, context: _TemplateContext) -> str:
+    compiled = hint.compiled
+    if compiled is None:
+        return hint.value.format_map(context)
+    if len(compiled) == 1:
+        # Bare "{field}"/"{field:spec}" templates skip the join entirely.
+        literal, field_name, format_spec, conversion = compiled[0]
+        if not literal and field_name is not None and not conversion:
+            return format(context[field_name], format_spec)
+    parts: list[str] = []
+    for literal, field_name, format_spec, conversion in compiled:
+        if literal:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        value = context[field_name]
+        if conversion:
+            value = _CONVERSIONS[conversion](value)
+        parts.append(format(value, format_spec))
+    return "".join(parts)
+
+
+class _TemplateContext:
+    """Lookup adapter resolving template fields straight from the hint context.
+
+    Instance attributes (or mapping keys) of ``source`` take precedence over
+    the collection ``index``; methods and properties are never consulted, and
+    nothing is copied into an intermediate dict.
+    """
+
+    __slots__ = ("_source", "_index")
+
+    def __init__(self, source: Any, index: int | None) -> None:
+        self._source = source
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        source = self._source
+        if isinstance(source, Mapping):
+            if key in source:
+                return source[key]
+        elif source is not None:
+            namespace = getattr(source, "__dict__", None)
+            if namespace is not None:
+                if key in namespace:
+                    return namespace[key]
+            elif key in getattr(source, "__dataclass_fields__", ()):
+                # Slotted dataclasses have no __dict__; their fields are
+                # still plain instance data.
+                return getattr(source, key)
+        if key == "index" and self._index is not None:
+            return self._index
+        raise KeyError(key)
 
 
 def _default_name(field_name: str, index: int | None) -> str:
@@ -186,108 +364,150 @@ def _default_name(field_name: str, index: int | None) -> str:
 
 
 def _apply_prefix(prefix: str, name: str) -> str:
-    return str(Path(prefix) / name)
+    return os.path.join(prefix, name)
+
+
+def _adapt_hint_callable(
+    func: Callable[..., Any]
+) -> Callable[[Any, int | None], str]:
+    """Return a ``(context, index)`` adapter matching ``func``'s signature.
+
+    The signature is inspected once; the adapter passes the context when the
+    callable takes a positional parameter and the index when it has room for
+    one (a second positional parameter or ``*args``).
+    """
+
+    arity = _callable_arity(func)
+    if arity is None:
+        return lambda context, index: str(
+            func(context) if index is None else func(context, index)
+        )
+    positional_count, has_varargs = arity
+    if not positional_count:
+        if not has_varargs:
+            return lambda context, index: str(func())
+        return lambda context, index: str(func() if index is None else func(index))
+    if has_varargs or positional_count > 1:
+        return lambda context, index: str(
+            func(context) if index is None else func(context, index)
+        )
+    return lambda context, index: str(func(context))
+
 
+def _callable_arity(func: Callable[..., Any]) -> tuple[int, bool] | None:
+    """Return ``(positional parameter count, accepts *args)`` for ``func``.
+
+    ``None`` means the signature cannot be inspected. Called once per field
+    when its renderer is compiled, so nothing is cached here.
+    """
 
-def _invoke_hint_callable(
-    func: Callable[..., Any], context: Any, index: int | None
-) -> str:
     try:
         sig = inspect.signature(func)
     except (TypeError, ValueError):
-        return str(func(context) if index is None else func(context, index))
-
-    params = [
-        p
-        for p in sig.parameters.values()
-        if p.kind
-        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ]
-    has_varargs = any(
-        p.kind == inspect.Parameter.VAR_POSITIONAL for p in sig.parameters.values()
-    )
-    args: list[Any] = []
-    if not params and not has_varargs:
-        return str(func())
-    if params:
-        args.append(context)
-    if index is not None and (has_varargs or len(args) < len(params)):
-        args.append(index)
-    return str(func(*args))
+        return None
+    positional_count = 0
+    has_varargs = False
+    for param in sig.parameters.values():
+        if param.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            positional_count += 1
+        elif param.kind == inspect.Parameter.VAR_POSITIONAL:
+            has_varargs = True
+    return positional_count, has_varargs
+
+
+# json.dump/dumps build a new JSONEncoder for every call with non-default
+# options; these encoders are stateless between calls and safe to share.
+_encode_json = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+_encode_json_line = json.JSONEncoder(ensure_ascii=False).encode
+_JSONL_BUFFER_SIZE = 1 << 20
 
 
-def _write_payload(target: Path, payload: Any, extension: str | None) -> None:
+def _write_payload(target: str, payload: Any, extension: str | None) -> None:
     if isinstance(payload, bytes):
-        target.write_bytes(payload)
+        with open(target, "wb") as fp:
+            fp.write(payload)
         return
     if isinstance(payload, str):
-        target.write_text(payload)
+        with open(target, "w") as fp:
+            fp.write(payload)
         return
     if extension == "json":
-        with target.open("w", encoding="utf-8") as fp:
-            json.dump(payload, fp, indent=2, ensure_ascii=False)
+        # Encode in one step and write raw bytes, skipping the text layer.
+        data = _encode_json(payload).encode("utf-8")
+        with open(target, "wb") as fp:
+            fp.write(data)
         return
     if extension == "jsonl":
         if not isinstance(payload, Iterable) or isinstance(
             payload, (str, bytes, bytearray)
         ):
             raise RenderError("jsonl payload must be an iterable of records.")
-        with target.open("w", encoding="utf-8") as fp:
-            for row in payload:
-                fp.write(json.dumps(row, ensure_ascii=False))
-                fp.write("\n")
+        encode = _encode_json_line
+        # Stream records through a large buffer so big files reach the kernel
+        # in few, large writes without materializing the whole document.
+        with open(target, "wb", buffering=_JSONL_BUFFER_SIZE) as fp:
+            fp.writelines((encode(row) + "\n").encode("utf-8") for row in payload)
         return
     if hasattr(payload, "read"):
-        target.write_bytes(payload.read())
+        with open(target, "wb") as fp:
+            fp.write(payload.read())
         return
     raise RenderError(
         f"Unsupported payload type for field output: {type(payload).__name__}."
     )
 
 
-def _copy_file_payload(source_path: Path | None, target: Path) -> bool:
+def _copy_file_payload(source_path: str | None, target: str) -> bool:
     if source_path is None:
         warnings.warn(
             "copyfile metadata requires a string or path-like payload; falling back to default serialization.",
             RuntimeWarning,
         )
         return False
-    if not source_path.exists():
-        warnings.warn(
-            f"copyfile source '{source_path}' does not exist; falling back to default serialization.",
-            RuntimeWarning,
-        )
-        return False
-    if source_path.is_dir():
-        warnings.warn(
-            f"copyfile source '{source_path}' is a directory; falling back to default serialization.",
-            RuntimeWarning,
-        )
-        return False
+    import shutil  # deferred: only copyfile assets need it
+
     try:
         shutil.copy2(source_path, target)
     except OSError as exc:
-        warnings.warn(
-            f"copyfile unable to copy '{source_path}' -> '{target}': {exc}; falling back to default serialization.",
-            RuntimeWarning,
-        )
+        # Diagnose only on failure so successful copies cost no extra stats.
+        if not os.path.exists(source_path):
+            warnings.warn(
+                f"copyfile source '{source_path}' does not exist; falling back to default serialization.",
+                RuntimeWarning,
+            )
+        elif os.path.isdir(source_path):
+            warnings.warn(
+                f"copyfile source '{source_path}' is a directory; falling back to default serialization.",
+                RuntimeWarning,
+            )
+        else:
+            warnings.warn(
+                f"copyfile unable to copy '{source_path}' -> '{target}': {exc}; falling back to default serialization.",
+                RuntimeWarning,
+            )
         return False
     return True
 
 
-def _pathlike_or_none(value: Any) -> Path | None:
-    if isinstance(value, Path):
+def _pathlike_or_none(value: Any) -> str | None:
+    # Copy sources stay plain strings; no Path object is built per asset.
+    if isinstance(value, str):
         return value
-    if isinstance(value, (str, PathLike)):
-        return Path(value)
+    if isinstance(value, PathLike):
+        return os.fspath(value)
     return None
 
 
-def _infer_extension_from_source(source_path: Path | None) -> str | None:
+def _infer_extension_from_source(source_path: str | None) -> str | None:
     if source_path is None:
         return None
-    suffix = source_path.suffix
-    if not suffix:
+    # Same result as Path(source_path).suffix without the Path parsing.
+    name = os.path.basename(os.path.normpath(source_path))
+    dot = name.rfind(".")
+    if not 0 < dot < len(name) - 1:
         return None
-    normalized = suffix.lstrip(".")
+    normalized = name[dot:].lstrip(".")
     return normalized or None
@@ -98,3 +98,70 @@ def test_infer_bundle_rejects_unknown_extension(tmp_path):
 
     with pytest.raises(ValueError):
         infer_bundle_from_directory(root)
+
+
+def test_infer_bundle_many_files_round_trip(tmp_path):
+    root = tmp_path / "wide"
+    for index in range(12):
+        run = root / f"run-{index:03d}"
+        run.mkdir(parents=True)
+        (run / "payload.txt").write_text(f"run {index}", encoding="utf-8")
+        _write_json(run / "metrics.json", {"index": index})
+        (run / "inner").mkdir()
+        (run / "inner" / "note.txt").write_text(f"note {index}", encoding="utf-8")
+
+    inferred = infer_bundle_from_directory(root)
+
+    assert inferred.instance.run_011.payload == "run 11"
+    assert inferred.instance.run_003.metrics == {"index": 3}
+    run_classes = [type(getattr(inferred.instance, f"run_{i:03d}")) for i in range(12)]
+    assert len({cls.__name__ for cls in run_classes}) == 12
+    shared_base = run_classes[0].__bases__[0]
+    assert all(cls.__bases__ == (shared_base,) for cls in run_classes)
+    assert not issubclass(run_classes[1], run_classes[0])
+    for index, cls in enumerate(run_classes):
+        inner_field = cls.__bundle_definition__.fields_by_name["inner"]
+        inner = getattr(inferred.instance, f"run_{index:03d}").inner
+        assert isinstance(inner, inner_field.dir_payload_cls)
+    assert len(inferred.schema["$defs"]) == 25
+
+    out_dir = tmp_path / "wide-copy"
+    inferred.instance.write(out_dir)
+    assert _collect_files(root) == _collect_files(out_dir)
+
+
+def test_inferred_bundle_schema_is_a_dataclass_field(tmp_path):
+    from dataclasses import fields
+
+    root = tmp_path / "tiny"
+    root.mkdir()
+    (root / "notes.txt").write_text("hi", encoding="utf-8")
+
+    inferred = infer_bundle_from_directory(root)
+    rebuilt = InferredBundle(
+        root_class=inferred.root_class,
+        instance=inferred.instance,
+        schema=inferred.schema,
+    )
+
+    assert [f.name for f in fields(InferredBundle)] == ["root_class", "instance", "schema"]
+    assert rebuilt == inferred
+    assert "schema=" in repr(rebuilt)
+
+
+def test_inferred_schema_properties_are_independent(tmp_path):
+    root = tmp_path / "shapes"
+    for name in ("a", "b"):
+        (root / name).mkdir(parents=True)
+        _write_json(
+            root / name / "meta.json", {"score": 1, "rank": 2, "tags": ["x"]}
+        )
+
+    schema = infer_bundle_from_directory(root).schema
+    first = schema["$defs"]["A"]["properties"]["meta"]
+    second = schema["$defs"]["B"]["properties"]["meta"]
+    first["properties"]["score"]["minimum"] = 0
+
+    assert "minimum" not in second["properties"]["score"]
+    assert "minimum" not in first["properties"]["rank"]
+    assert first["properties"]["tags"] is not second["properties"]["tags"]
@@ -1,6 +1,8 @@
 from typing import Dict, List, Union
 
-from pyarty import Dir, FieldKind, File, HintKind, bundle, twig
+import pytest
+
+from pyarty import BundleMetadataError, Dir, FieldKind, File, HintKind, bundle, twig
 
 
 def test_bundle():
@@ -52,27 +54,21 @@ def test_bundle():
         "slug_file",
         "static_file",
     ]
-    my_file_field = next(
-        field for field in bundle_definition.fields if field.name == "my_file"
-    )
+    my_file_field = bundle_definition.fields_by_name["my_file"]
     my_file_metadata = my_file_field.metadata[0]
     assert my_file_metadata.layer is File
     callable_hint = my_file_metadata.data["name"]
     assert callable_hint.kind is HintKind.CALLABLE
     assert callable_hint.value is _generate_file_name
 
-    slug_file_field = next(
-        field for field in bundle_definition.fields if field.name == "slug_file"
-    )
+    slug_file_field = bundle_definition.fields_by_name["slug_file"]
     slug_file_metadata = slug_file_field.metadata[0]
     name_hint = slug_file_metadata.data["name"]
     assert name_hint.kind is HintKind.TEMPLATE
     assert name_hint.value == "{slug}"
     assert name_hint.source == "self"
 
-    static_file_field = next(
-        field for field in bundle_definition.fields if field.name == "static_file"
-    )
+    static_file_field = bundle_definition.fields_by_name["static_file"]
     static_file_metadata = static_file_field.metadata[0]
     static_name_hint = static_file_metadata.data["name"]
     assert static_name_hint.kind is HintKind.LITERAL
@@ -106,6 +102,25 @@ def test_bundle_allows_metadata_field_and_runtime_metadata_kwarg():
     assert report.metadata == {"score": 10}
     assert report.__bundle_instance_metadata__["runtime"] is True
 
+    plain = Report(name="beta", body="payload", metadata={})
+    assert plain.__bundle_instance_metadata__ is None
+
+
+def test_runtime_metadata_visible_in_post_init():
+    seen = []
+
+    @bundle
+    class Tracked:
+        body: File[str]
+
+        def __post_init__(self):
+            seen.append(self.__bundle_instance_metadata__)
+
+    Tracked(body="x", __bundle_metadata__={"run": 1})
+    Tracked(body="y")
+
+    assert seen == [{"run": 1}, None]
+
 
 def test_article_corpus_structure():
 
@@ -259,10 +274,9 @@ def test_article_corpus_structure():
     assert table_name_meta.source == "self"
 
     corpus_def = ArticleCorpus.__bundle_definition__
-    articles_field = next(
-        field for field in corpus_def.fields if field.name == "articles"
-    )
+    articles_field = corpus_def.fields_by_name["articles"]
     assert articles_field.kind == FieldKind.DIR
+    assert articles_field.dir_payload_cls is ArticleBundle
     articles_name_hint = articles_field.metadata[0].data["name"]
     assert articles_name_hint.kind is HintKind.CALLABLE
 
@@ -279,13 +293,14 @@ def test_field_based_template_naming():
         reports: Dir[List[Report]] = twig(name=("{name}", "field"))
 
     report_def = ReportSet.__bundle_definition__
-    reports_field = next(
-        field for field in report_def.fields if field.name == "reports"
-    )
+    reports_field = report_def.fields_by_name["reports"]
     name_hint = reports_field.metadata[0].data["name"]
     assert name_hint.kind is HintKind.TEMPLATE
     assert name_hint.source == "field"
     assert name_hint.value == "{name}"
+    assert reports_field.name_hint is name_hint
+    assert reports_field.prefix_hint is None
+    assert reports_field.copyfile is False
 
 
 def test_extension_inference_variants():
@@ -299,7 +314,7 @@ def test_extension_inference_variants():
         logs: File[List[str]]
 
     definition = Extensions.__bundle_definition__
-    extensions = {field.name: field for field in definition.fields}
+    extensions = definition.fields_by_name
 
     def _extension_for(name: str) -> str:
         entry = extensions[name]
@@ -310,6 +325,7 @@ def test_extension_inference_variants():
     assert _extension_for("settings") == "json"
     assert _extension_for("records") == "jsonl"
     assert _extension_for("logs") == "txt"
+    assert extensions["records"].extension == "jsonl"
 
 
 def test_callable_name_with_varargs():
@@ -324,9 +340,125 @@ def test_callable_name_with_varargs():
         payload: File[int] = twig(name=variant_name)
 
     definition = Variant.__bundle_definition__
-    payload_field = next(
-        field for field in definition.fields if field.name == "payload"
-    )
+    payload_field = definition.fields_by_name["payload"]
     hint = payload_field.metadata[0].data["name"]
     assert hint.kind is HintKind.CALLABLE
     assert hint.value is variant_name
+
+
+def test_redecorating_bundle_reuses_definition():
+
+    @bundle
+    class Payload:
+        text: File[str]
+
+    definition = Payload.__bundle_definition__
+    assert bundle(Payload) is Payload
+    assert Payload.__bundle_definition__ is definition
+
+
+def test_bundle_subclass_without_fields_reuses_parent_fields(tmp_path):
+
+    @bundle
+    class Payload:
+        text: File[str]
+
+    @bundle
+    class NamedPayload(Payload):
+        pass
+
+    definition = NamedPayload.__bundle_definition__
+    assert definition.cls is NamedPayload
+    assert definition.fields is Payload.__bundle_definition__.fields
+    NamedPayload(text="hi").write(tmp_path / "out")
+    assert (tmp_path / "out" / "text.txt").read_text() == "hi"
+
+
+def test_bundle_subclass_keeps_fields_from_intermediate_dataclass(tmp_path):
+    from dataclasses import dataclass
+
+    @bundle
+    class Base:
+        x: File[str]
+
+    @dataclass
+    class Middle(Base):
+        y: File[str] = "why"
+
+    @bundle
+    class Leaf(Middle):
+        pass
+
+    assert [f.name for f in Leaf.__bundle_definition__.fields] == ["x", "y"]
+    Leaf(x="ex").write(tmp_path / "out")
+    assert (tmp_path / "out" / "x.txt").read_text() == "ex"
+    assert (tmp_path / "out" / "y.txt").read_text() == "why"
+
+
+def test_definition_field_partitions():
+
+    @bundle
+    class Leaf:
+        text: File[str]
+
+    @bundle
+    class Root:
+        label: str
+        single: Dir[Leaf]
+        many: Dir[List[Leaf]]
+        notes: File[str]
+
+    definition = Root.__bundle_definition__
+    assert [f.name for f in definition.dir_fields] == ["single", "many"]
+    assert [f.name for f in definition.file_fields] == ["notes"]
+    assert [f.name for f in definition.value_fields] == ["label"]
+    assert [f.name for f in definition.collection_dir_fields] == ["many"]
+    assert definition.fields_by_name["notes"] is definition.file_fields[0]
+    assert definition.field_names == {"label", "single", "many", "notes"}
+
+
+def test_malformed_template_name_rejected():
+    with pytest.raises(BundleMetadataError):
+
+        @bundle
+        class Broken:
+            payload: File[str] = twig(name="{slug")
+
+
+def test_field_metadata_is_read_only():
+
+    @bundle
+    class First:
+        settings: File[dict]
+
+    @bundle
+    class Second:
+        settings: File[dict]
+
+    first = First.__bundle_definition__.fields_by_name["settings"]
+    second = Second.__bundle_definition__.fields_by_name["settings"]
+    with pytest.raises(TypeError):
+        first.metadata[0].data["extension"] = "yaml"
+    with pytest.raises(TypeError):
+        first.raw_metadata["x"] = 1
+    assert second.metadata[0].data["extension"] == "json"
+    assert second.raw_metadata == {}
+
+
+def test_invalid_annotation_errors_name_each_bundle():
+    from pyarty.dsl import InvalidBundleAnnotation
+
+    for name in ("First", "Second"):
+        with pytest.raises(InvalidBundleAnnotation, match=f"bundle '{name}'"):
+            bundle(type(name, (), {"__annotations__": {"payload": Dir[int]}}))
+
+
+def test_submodules_resolve_as_package_attributes():
+    import subprocess
+    import sys
+
+    code = "import pyarty; print(pyarty.writer.__name__, pyarty.reader.__name__)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["pyarty.writer", "pyarty.reader"]
@@ -6,7 +6,7 @@ from typing import List
 
 import pytest
 
-from pyarty import Dir, File, bundle, twig
+from pyarty import BundleDefinition, BundleField, Dir, File, RenderError, bundle, twig
 
 
 @bundle
@@ -158,3 +158,159 @@ def test_copyfile_missing_warns_and_falls_back(tmp_path):
         bundle_instance.write(out_dir)
     target = out_dir / "asset.txt"
     assert target.read_text() == str(missing)
+
+
+def test_copyfile_directory_source_warns(tmp_path):
+    source_dir = tmp_path / "assets"
+    source_dir.mkdir()
+    out_dir = tmp_path / "copy-dir"
+    with pytest.warns(RuntimeWarning, match="is a directory"):
+        CopyFileBundle(asset=str(source_dir)).write(out_dir)
+    assert (out_dir / "asset.txt").read_text() == str(source_dir)
+
+
+@bundle
+class FormattedName:
+    index: int
+    payload: File[str] = twig(name="run-{index:03d}")
+
+
+def test_template_format_spec(tmp_path):
+    out_dir = tmp_path / "formatted"
+    FormattedName(index=7, payload="x").write(out_dir)
+    assert (out_dir / "run-007.txt").read_text() == "x"
+
+
+@bundle
+class IndexedNode:
+    slug: str
+    payload: File[str]
+
+
+@bundle
+class IndexedTree:
+    nodes: Dir[List[IndexedNode]] = twig(name=("{slug}-{index}", "field"))
+
+
+def test_template_index_and_missing_variable(tmp_path):
+    tree = IndexedTree(
+        nodes=[IndexedNode(slug="a", payload="x"), IndexedNode(slug="b", payload="y")]
+    )
+    out_dir = tmp_path / "indexed"
+    tree.write(out_dir)
+    assert (out_dir / "b-1" / "payload.txt").read_text() == "y"
+
+    @bundle
+    class Missing:
+        payload: File[str] = twig(name="{absent}")
+
+    with pytest.raises(RenderError):
+        Missing(payload="x").write(tmp_path / "missing")
+
+
+def test_template_ignores_methods_and_properties(tmp_path):
+    @bundle
+    class Methods:
+        payload: File[str] = twig(name="{write}")
+
+    with pytest.raises(RenderError):
+        Methods(payload="x").write(tmp_path / "methods")
+
+    @bundle(slots=True)
+    class Slotted:
+        slug: str
+        payload: File[str] = twig(name="{slug}")
+
+    Slotted(slug="s", payload="x").write(tmp_path / "slotted")
+    assert (tmp_path / "slotted" / "s.txt").read_text() == "x"
+
+
+def test_renderer_cached_per_bundle_class(tmp_path):
+    FormattedName(index=1, payload="a").write(tmp_path / "first")
+    cached = FormattedName.__dict__["__bundle_renderer__"]
+    FormattedName(index=2, payload="b").write(tmp_path / "second")
+    assert FormattedName.__dict__["__bundle_renderer__"] is cached
+    assert (tmp_path / "second" / "run-002.txt").read_text() == "b"
+
+
+@bundle
+class EmptyLeaf:
+    label: str
+
+
+@bundle
+class NestedEmptyTree:
+    outer: Dir[EmptyLeaf] = twig(name="outer", prefix="nested/levels")
+    sibling: Dir[EmptyLeaf]
+
+
+def test_empty_and_prefixed_directories_created(tmp_path):
+    out_dir = tmp_path / "empty-tree"
+    NestedEmptyTree(outer=EmptyLeaf("a"), sibling=EmptyLeaf("b")).write(out_dir)
+    assert (out_dir / "nested" / "levels" / "outer").is_dir()
+    assert (out_dir / "sibling").is_dir()
+
+
+@bundle
+class ManyFilesEntry:
+    slug: str
+    body: File[str] = twig(name="{slug}")
+    meta: File[dict]
+
+
+@bundle
+class ManyFilesTree:
+    entries: Dir[List[ManyFilesEntry]] = twig(name=("{slug}", "field"))
+
+
+def test_many_files_written(tmp_path):
+    tree = ManyFilesTree(
+        entries=[
+            ManyFilesEntry(slug=f"e{index}", body=f"body {index}", meta={"i": index})
+            for index in range(10)
+        ]
+    )
+    out_dir = tmp_path / "many"
+    tree.write(out_dir)
+    for index in range(10):
+        entry_dir = out_dir / f"e{index}"
+        assert (entry_dir / f"e{index}.txt").read_text() == f"body {index}"
+        assert json.loads((entry_dir / "meta.json").read_text()) == {"i": index}
+
+
+def test_hand_built_definition_renders(tmp_path):
+
+    @bundle
+    class Manual:
+        text: File[str] = twig(name="x")
+
+    built = Manual.__bundle_definition__.fields[0]
+    rebuilt = BundleField(
+        name=built.name,
+        kind=built.kind,
+        annotation=built.annotation,
+        dataclass_field=built.dataclass_field,
+        metadata=built.metadata,
+        raw_metadata=built.raw_metadata,
+    )
+    assert rebuilt.name_hint is built.name_hint
+    assert rebuilt.extension == "txt"
+    Manual.__bundle_definition__ = BundleDefinition(cls=Manual, fields=[rebuilt])
+    Manual(text="hi").write(tmp_path / "manual")
+    assert (tmp_path / "manual" / "x.txt").read_text() == "hi"
+
+
+@bundle
+class OverlapLeaf:
+    x: File[str]
+
+
+@bundle
+class OverlapRoot:
+    x: File[str] = twig(prefix="d")
+    d: Dir[OverlapLeaf] = None
+
+
+def test_fields_render_in_declaration_order(tmp_path):
+    OverlapRoot(x="root", d=OverlapLeaf(x="leaf")).write(tmp_path / "out")
+    assert (tmp_path / "out" / "d" / "x.txt").read_text() == "leaf"